@@ -4,31 +4,45 @@ A :class:`.Corpus` is a container for :class:`.Paper`\s.
 
 from collections import Counter, defaultdict
 from itertools import chain
+from bisect import bisect_left
 import hashlib
 import copy
-from math import log
 
 from tethne.classes.feature import FeatureSet, Feature, \
-                                   StructuredFeatureSet, StructuredFeature
+                                   StructuredFeatureSet, StructuredFeature, \
+                                   _featureset_class
 from tethne.utilities import _iterable, argsort
 
+try:    # Only needed for vectorized feature weighting (e.g. Corpus.tfidf).
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = sparse = None
+
 import sys
 import os
 PYTHON_3 = sys.version_info[0] == 3
 if PYTHON_3:
     unicode = str
+    _intern = sys.intern
+else:
+    _intern = intern
 
 
-def _tfidf(f, c, C, DC, N):
-    tf = float(c)
-    idf = log(float(N)/float(DC))
-    return tf*idf
-
+def _hexdigests(data):
+    """
+    Yields an MD5 hex digest for each byte string in ``data``.
 
-def _filter(s, C, DC):
-    if C > 3 and DC > 1 and len(s) > 3:
-        return True
-    return False
+    Generated identifiers are persisted (e.g. as graph node ids), so the
+    algorithm must not depend on which optional packages are installed. A
+    single empty hasher is copied, rather than constructing a new one for
+    every string.
+    """
+    hasher = hashlib.md5()
+    for datum in data:
+        h = hasher.copy()
+        h.update(datum)
+        yield h.hexdigest()
 
 
 class Corpus(object):
@@ -41,6 +55,7 @@ class Corpus(object):
 
        distribution
        feature_distribution
+       feature_year_matrix
        features
        index
        index_by
@@ -51,6 +66,7 @@ class Corpus(object):
        select
        slice
        subcorpus
+       tfidf
        top_features
 
     :class:`.Corpus` objects are generated by the bibliographic readers in the
@@ -159,6 +175,15 @@ class Corpus(object):
         """
         return list(self.indexed_papers.values())
 
+    @property
+    def _ids(self):
+        """
+        Primary index keys, in the same order as :attr:`.papers`\.
+        """
+        if self._ids_list is None:
+            self._ids_list = list(self.indexed_papers.keys())
+        return self._ids_list
+
     index_by = None
     """
     Specifies the field in :class:`.Paper`\s that should be used as the
@@ -244,6 +269,8 @@ class Corpus(object):
         self.indices = {}
         self.features = {}
         self.duplicate_papers = {}
+        self._slice_cache = {}
+        self._ids_list = None
         self.indices = defaultdict(dict)
         self.indices_lookup = defaultdict(dict)
         if index_by not in index_fields:
@@ -259,17 +286,27 @@ class Corpus(object):
             if field not in self.features:
                 self._init_featureset(field)
 
-        for paper in papers:
-            self._index_paper(paper)
+        self.add_papers(papers)
 
     def add_papers(self, papers):
+        papers = list(papers)
+        self._hash_papers(papers)
         for paper in papers:
             self._index_paper(paper)
 
     def __len__(self):
         return len(self.indexed_papers)
 
+    def _clear_slice_cache(self):
+        """
+        Dates and distributions computed from slices are cached; they must be
+        discarded whenever papers, indices, or features change.
+        """
+        self._slice_cache.clear()
+
     def _index_paper(self, paper):
+        self._clear_slice_cache()
+        self._ids_list = None
         key = self._generate_index(paper)
 
         # if key not in self.indexed_papers.keys():
@@ -295,35 +332,62 @@ class Corpus(object):
         """
         If the ``index_by`` field is not set or not available, generate a unique
         identifier using the :class:`.Paper`\'s title and author names.
+
+        The identifier is cached on the :class:`.Paper` (along with the value
+        of ``index_by`` that produced it), so that repeated calls are cheap.
         """
+        cached = getattr(paper, '_tethne_id', None)
+        if cached is not None and cached[0] == self.index_by:
+            return cached[1]
+
         if self.index_by is None or not hasattr(paper, self.index_by):
             if not hasattr(paper, 'hashIndex'): # Generate a new index for this paper.
-                m = hashlib.md5()
+                self._hash_papers([paper])
+            identifier = getattr(paper, 'hashIndex')
+        else:
+            identifier = getattr(paper, self.index_by)
+            if type(identifier) is list:
+                identifier = identifier[0]
+            if self.index_by == 'link':
+                _, identifier = os.path.split(identifier)
 
-                # If we dont have author name then we just use the title of the paper
-                # to generate unique identifier.
-                if paper.authors is None:
-                    hashable = paper.title
-                else:
-                    if hasattr(paper, 'title'):
-                        title = paper.title
-                    else:
-                        title = ''
-                    if len(paper.authors) == 0:
-                        hashable = title
-                    else:
-                        authors = list(zip(*paper.authors))[0]
-                        hashable = u' '.join(list([title] + [l + f for l, f in authors]))
-
-                m.update(hashable.encode('utf-8'))
-                setattr(paper, 'hashIndex', m.hexdigest())
-            return getattr(paper, 'hashIndex')
-        identifier = getattr(paper, self.index_by)
-        if type(identifier) is list:
-            identifier = identifier[0]
-        if self.index_by == 'link':
-            _, identifier = os.path.split(identifier)
-        return identifier    # Identifier is already available.
+        paper._tethne_id = (self.index_by, identifier)
+        return identifier
+
+    def _hash_papers(self, papers):
+        """
+        Sets ``hashIndex`` on any of ``papers`` that will need a generated
+        identifier (see :meth:`._generate_index`\), all in one pass.
+        """
+        unhashed = [paper for paper in papers
+                    if (self.index_by is None
+                        or not hasattr(paper, self.index_by))
+                    and not hasattr(paper, 'hashIndex')]
+        hashables = [self._hashable(paper) for paper in unhashed]
+        for paper, digest in zip(unhashed, _hexdigests(hashables)):
+            paper.hashIndex = digest
+
+    @staticmethod
+    def _hashable(paper):
+        # Paper.authors builds a new Feature on every access, so only get it
+        #  once.
+        authors = paper.authors
+
+        # If we dont have author name then we just use the title of the paper
+        # to generate unique identifier.
+        if authors is None:
+            hashable = paper.title
+        else:
+            title = getattr(paper, 'title', '')
+            if len(authors) == 0:
+                hashable = title
+            else:
+                hashable = u' '.join(chain([title], (l + f for (l, f), _
+                                                     in authors)))
+
+        if type(hashable) is unicode:
+            hashable = hashable.encode('utf-8')
+        return hashable
 
     def _init_featureset(self, feature_name, structured=False):
         if structured:
@@ -362,10 +426,50 @@ class Corpus(object):
             The name of a :class:`.Paper` attribute.
 
         """
-        self._init_featureset(feature_name, structured=structured)
+        self._clear_slice_cache()
+        if structured:
+            fsclass, fclass = StructuredFeatureSet, StructuredFeature
+        else:
+            fsclass, fclass = FeatureSet, Feature
 
-        for paper in self.papers:
-            self.index_paper_by_feature(paper, feature_name, tokenize, structured)
+        # Keys in the primary index are already paper identifiers, so there is
+        #  no need to regenerate them here.
+        self.features[feature_name] = fsclass({
+            i: fclass(tokenize(copy.deepcopy(getattr(paper, feature_name))))
+            for i, paper in self.indexed_papers.items()
+            if hasattr(paper, feature_name)
+        })
+
+    def _index_values(self, paper, attr):
+        """
+        Generates the keys under which ``paper`` should be indexed for the
+        attribute ``attr``.
+        """
+        value = getattr(paper, attr)
+
+        # Elements of a Feature are (value, count) tuples; we only index on
+        #  the value. This doesn't vary within a paper, so check it once.
+        is_feature = type(value) is Feature
+        values = []
+        for v in _iterable(value):
+            if is_feature:
+                v_ = v[:-1]
+            else:
+                v_ = v
+
+            if hasattr(v_, '__iter__') and len(v_) == 1:
+                t = type(v_[0])
+                v_ = t(v_[0])
+
+            # Values like citations recur across many papers. Interning them
+            #  saves memory, and lets dict lookups compare by identity. This
+            #  only applies to native str values: on Python 2 the bundled
+            #  readers produce unicode, which intern() does not accept, so
+            #  there it only affects byte-string values from other sources.
+            if type(v_) is str:
+                v_ = _intern(v_)
+            values.append(v_)
+        return values
 
     def index_paper_by_attr(self, paper, attr):
         i = self._generate_index(paper)
@@ -373,33 +477,21 @@ class Corpus(object):
             return
 
         if hasattr(paper, attr):
-            value = copy.deepcopy(getattr(paper, attr))
-            for v in _iterable(value):
-                if type(value) is Feature:
-                    v_ = v[:-1]
-                else:
-                    v_ = v
-
-                if hasattr(v_, '__iter__'):
-                    if len(v_) == 1:
-                        t = type(v_[0])
-                        v_ = t(v_[0])
+            values = self._index_values(paper, attr)
+            index = self.indices[attr]
+            for v_ in values:
+                index.setdefault(v_, []).append(i)
 
-                if v_ not in self.indices[attr]:
-                    self.indices[attr][v_] = []
-                self.indices[attr][v_].append(i)
-
-                # For more efficient lookup later.
-                if attr not in self.indices_lookup[i]:
-                    self.indices_lookup[i][attr] = []
-                self.indices_lookup[i][attr].append(v_)
+            # For more efficient lookup later.
+            self.indices_lookup[i].setdefault(attr, []).extend(values)
 
     def index(self, attr):
         """
         Indexes the :class:`.Paper`\s in this :class:`.Corpus` instance
         by the attribute ``attr``.
 
-        New indices are added to :attr:`.indices`\.
+        New indices are added to :attr:`.indices`\. If ``attr`` was already
+        indexed, that index is rebuilt from scratch.
 
         Parameters
         ----------
@@ -408,18 +500,30 @@ class Corpus(object):
 
         """
 
-        for i, paper in self.indexed_papers.iteritems():
-            self.index_paper_by_attr(paper, attr)
+        self._clear_slice_cache()
+
+        # Gather the index values for every paper first, so that the index
+        #  itself can be built in a single tight loop.
+        values_by_paper = [(i, self._index_values(paper, attr))
+                           for i, paper in self.indexed_papers.iteritems()
+                           if hasattr(paper, attr)]
 
+        index = defaultdict(list)
+        for i, values in values_by_paper:
+            for v_ in values:
+                index[v_].append(i)
+            self.indices_lookup[i][attr] = values
+        self.indices[attr] = dict(index)
 
     def __getitem__(self, selector):
         return self.select(selector)
 
     def __getattr__(self, key):
-        if hasattr(self, key):
-            return getattr(self, key)
-        elif key in self.indices:
-            return self.indices[key]
+        # Only called when normal attribute lookup fails. Go straight to the
+        #  instance dict, to avoid recursing back into __getattr__.
+        indices = self.__dict__.get('indices', {})
+        if key in indices:
+            return indices[key]
         raise AttributeError("Corpus has no such attribute")
 
     def select(self, selector, index_only=False):
@@ -473,45 +577,79 @@ class Corpus(object):
             A list of :class:`.Paper`\s.
         """
 
-        papers = []
-        if type(selector) is tuple: # Select papers by index.
-            index, value = selector
-            if type(value) is list:  # Set of index values.
-                papers = [p for v in value for p in self.select((index, v), index_only=index_only)]
-            else:
-                if value in self.indices[index]:
-                    if index_only:
-                        papers = self.indices[index][value]
-                    else:
-                        papers = [self.indexed_papers[p] for p  # Single index value.
-                                  in self.indices[index][value]]
-                else:
-                    papers = []
-        elif type(selector) is list:
-            if selector[0] in self.indexed_papers:
-                # Selector is a list of primary indices.
-                if index_only:
-                    papers = selector
-                else:
-                    papers = [self.indexed_papers[s] for s in selector]
-            elif type(selector[0]) is int:
-                if index_only:
-                    papers = [self.indexed_papers.keys()[i] for i in selector]
-                else:
-                    papers = [self.papers[i] for i in selector]
-        elif type(selector) is int:
+        select = self._selectors.get(type(selector))
+        if select is None:
+            return []
+        return select(self, selector, index_only)
+
+    def _select_by_index(self, selector, index_only=False):
+        """
+        Select papers by index, e.g. ``('date', 1995)``.
+        """
+        index, value = selector
+        if type(value) is list:  # Set of index values.
+            # Take the union of identifiers up front, rather than selecting
+            #  each value separately.
+            values = self.indices[index]
+            ids = set().union(*[values[v] for v in value if v in values])
             if index_only:
-                papers = self.indexed_papers.keys()[selector]
-            else:
-                papers = self.papers[selector]
+                return list(ids)
+            return [self.indexed_papers[p] for p in ids]
 
-        elif type(selector) in [str, unicode]:
-            if selector in self.indexed_papers:
-                if index_only:
-                    papers = selector
-                else:
-                    papers = self.indexed_papers[selector]
-        return papers
+        if value not in self.indices[index]:
+            return []
+        if index_only:
+            return self.indices[index][value]
+        return [self.indexed_papers[p] for p  # Single index value.
+                in self.indices[index][value]]
+
+    def _select_list(self, selector, index_only=False):
+        """
+        Select papers by a list of positions, or a list of primary indices.
+        """
+        if len(selector) == 0:
+            return []
+
+        # Positions are the common case, and are cheaper to recognize than
+        #  (potentially long) primary index keys.
+        if type(selector[0]) is int:
+            keys = self._ids
+            if index_only:
+                return [keys[i] for i in selector]
+            return [self.indexed_papers[keys[i]] for i in selector]
+
+        if selector[0] in self.indexed_papers:
+            # Selector is a list of primary indices.
+            if index_only:
+                return selector
+            return [self.indexed_papers[s] for s in selector]
+        return []
+
+    def _select_position(self, selector, index_only=False):
+        """
+        Select a single paper by its position in the :class:`.Corpus`\.
+        """
+        if index_only:
+            return self._ids[selector]
+        return self.indexed_papers[self._ids[selector]]
+
+    def _select_key(self, selector, index_only=False):
+        """
+        Select a single paper by its primary index.
+        """
+        if selector not in self.indexed_papers:
+            return []
+        if index_only:
+            return selector
+        return self.indexed_papers[selector]
+
+    _selectors = {
+        tuple: _select_by_index,
+        list: _select_list,
+        int: _select_position,
+        str: _select_key,
+        unicode: _select_key,
+    }
 
     def slice(self, window_size=1, step_size=1, cumulative=False,
               count_only=False, subcorpus=True, feature_name=None):
@@ -567,29 +705,51 @@ class Corpus(object):
         generator
         """
 
+        # Only the dates that are actually present are visited in each window,
+        #  so sparse date distributions don't cost extra lookups.
+        dates = self._sorted_dates()
+        for year, start, stop in self._windows(window_size, step_size,
+                                               cumulative):
+            present = dates[bisect_left(dates, start):
+                            bisect_left(dates, stop)]
+            ids = list(chain.from_iterable(self.indices['date'][date]
+                                           for date in present))
+            if count_only:
+                yield year, len(ids)
+            elif feature_name:
+                yield year, self._subfeatures(ids, feature_name)
+            elif subcorpus:
+                yield year, self._subcorpus(ids)
+            else:
+                yield year, [self.indexed_papers[i] for i in ids]
+
+    def _sorted_dates(self):
+        """
+        All of the values in the ``date`` index, in order.
+        """
         if 'date' not in self.indices:
             self.index('date')
+        if 'dates' not in self._slice_cache:
+            self._slice_cache['dates'] = sorted(self.indices['date'].keys())
+        return self._slice_cache['dates']
 
-        start = min(self.indices['date'].keys())
-        end = max(self.indices['date'].keys())
+    def _windows(self, window_size=1, step_size=1, cumulative=False):
+        """
+        Yields ``(key, start, stop)`` for each time window used by
+        :meth:`.slice`\. ``stop`` is exclusive.
+        """
+        dates = self._sorted_dates()
+        if len(dates) == 0:
+            return
+        start = dates[0]
+        end = dates[-1]
 
         while start <= end - (window_size - 1):
-            selector = ('date', range(start, start + window_size, 1))
-            if cumulative:
-                year = start + window_size
-            else:
-                year = start
-            if count_only:
-                yield year, len(self.select(selector))
-            elif feature_name:
-                yield year, self.subfeatures(selector, feature_name)
-            elif subcorpus:
-                yield year, self.subcorpus(selector)
-            else:
-                yield year, self.select(selector)
             if cumulative:
+                yield start + window_size, start, start + window_size
                 window_size += step_size
             else:
+                yield start, start, start + window_size
                 start += step_size
 
     def distribution(self, **slice_kwargs):
@@ -613,13 +773,18 @@ class Corpus(object):
         -------
         list
         """
-        values = []
-        keys = []
+        cache_key = ('distribution', frozenset(slice_kwargs.items()))
+        if cache_key not in self._slice_cache:
+            values = []
+            keys = []
 
-        for key, size in self.slice(count_only=True, **slice_kwargs):
-            values.append(size)
-            keys.append(key)
-        return keys, values
+            for key, size in self.slice(count_only=True, **slice_kwargs):
+                values.append(size)
+                keys.append(key)
+            self._slice_cache[cache_key] = (keys, values)
+
+        keys, values = self._slice_cache[cache_key]
+        return list(keys), list(values)
 
     def feature_distribution(self, featureset_name, feature, mode='counts',
                              **slice_kwargs):
@@ -656,6 +821,42 @@ class Corpus(object):
         list
         """
 
+        fset = self.features[featureset_name]
+        cache_key = ('feature_distribution', featureset_name, feature, mode,
+                     frozenset(slice_kwargs.items()))
+        cached = self._slice_cache.get(cache_key)
+
+        # FeatureSets can be replaced by name (e.g. with the result of
+        #  FeatureSet.transform), so only reuse results from the same one.
+        if cached is None or cached[0] is not fset:
+            keys, values = self._feature_distribution(featureset_name, feature,
+                                                      mode, **slice_kwargs)
+            cached = (fset, keys, values)
+            self._slice_cache[cache_key] = cached
+
+        _, keys, values = cached
+        return list(keys), list(values)
+
+    def _feature_distribution(self, featureset_name, feature, mode,
+                              **slice_kwargs):
+        if sparse is not None:
+            years, matrix = self.feature_year_matrix(featureset_name, mode)
+            lookup = self.features[featureset_name].lookup
+
+            keys = []
+            values = []
+            if feature in lookup:
+                column = matrix[:, lookup[feature]].toarray().ravel()
+            for key, start, stop in self._windows(**slice_kwargs):
+                keys.append(key)
+                if feature in lookup and len(years) > 0:
+                    start = max(start - years[0], 0)
+                    values.append(float(column[start:stop - years[0]].sum()))
+                else:
+                    values.append(0.)
+            return keys, values
+
+        # Without scipy, count the feature window-by-window.
         values = []
         keys = []
         fset = self.features[featureset_name]
@@ -684,6 +885,76 @@ class Corpus(object):
             keys.append(key)
         return keys, values
 
+    def feature_year_matrix(self, featureset_name, mode='counts'):
+        """
+        Tabulates the features in a :class:`.FeatureSet` by publication year.
+
+        Requires numpy and scipy. The result is cached until the
+        :class:`.Corpus` is re-indexed, or the :class:`.FeatureSet` is
+        replaced.
+
+        Examples
+        --------
+        .. code-block:: python
+
+           >>> years, matrix = corpus.feature_year_matrix('citations')
+           >>> citations = corpus.features['citations']
+           >>> matrix[:, citations.lookup['DOLE RJ 1965 CELL']].toarray().ravel()
+           array([ 2.,  15.,  25.,  1.])
+
+        Parameters
+        ----------
+        featureset_name : str
+            Name of a :class:`.FeatureSet` in the :class:`.Corpus`\.
+        mode : str
+            (default: ``'counts'``) If set to ``'counts'``, values are the sum
+            of all count values for each feature in each year. If set to
+            ``'documentCounts'``, values are the number of papers in which the
+            feature occurs in each year.
+
+        Returns
+        -------
+        years : list
+            Every year from the earliest to the latest date in the
+            :class:`.Corpus`\, in the same order as the rows of ``matrix``.
+        matrix : :class:`scipy.sparse.csr_matrix`
+            Rows are years, and columns are features (see
+            :attr:`.FeatureSet.lookup`\).
+        """
+        if sparse is None:
+            raise ImportError('Corpus.feature_year_matrix() requires numpy'
+                              ' and scipy.')
+
+        fset = self.features[featureset_name]
+        cache_key = ('feature_year_matrix', featureset_name, mode)
+        cached = self._slice_cache.get(cache_key)
+        if cached is None or cached[0] is not fset:
+            dates = self._sorted_dates()
+            if len(dates) > 0:
+                years = list(range(dates[0], dates[-1] + 1))
+            else:
+                years = []
+
+            rows, cols, data = [], [], []
+            for date in dates:
+                for i in self.indices['date'][date]:
+                    if i not in fset.features:
+                        continue
+                    for elem, value in fset.features[i]:
+                        rows.append(date - years[0])
+                        cols.append(fset.lookup[elem])
+                        if mode == 'counts':
+                            data.append(value)
+                        else:
+                            data.append(1.)
+
+            matrix = sparse.coo_matrix((np.asarray(data, dtype=float),
+                                        (rows, cols)),
+                                       shape=(len(years), len(fset.lookup)))
+            cached = (fset, years, matrix.tocsr())
+            self._slice_cache[cache_key] = cached
+        return cached[1:]
+
     def top_features(self, featureset_name, topn=20, by='counts',
                      perslice=False, slice_kwargs={}):
         """
@@ -712,13 +983,70 @@ class Corpus(object):
                     for k, subcorpus in self.slice(**slice_kwargs)]
         return self.features[featureset_name].top(topn, by=by)
 
-    def subfeatures(self, selector, featureset_name):
-        indices = self.select(selector, index_only=True)
-        fclass = self.features[featureset_name].__class__
+    def tfidf(self, featureset_name):
+        """
+        Calculates term frequency * inverse document frequency for each feature
+        in each :class:`.Paper`\, for the :class:`.FeatureSet`
+        ``featureset_name``.
+
+        Weights are calculated for all papers at once, as a sparse matrix.
+        Requires numpy and scipy.
+
+        Examples
+        --------
+        .. code-block:: python
+
+           >>> papers, matrix = corpus.tfidf('wordcounts')
+           >>> words = corpus.features['wordcounts']
+           >>> matrix[0, words.lookup['evolution']]
+           4.1588830833596715
+
+        Parameters
+        ----------
+        featureset_name : str
+            Name of a :class:`.FeatureSet` in the :class:`.Corpus`\.
+
+        Returns
+        -------
+        papers : list
+            Paper identifiers, in the same order as the rows of ``matrix``.
+        matrix : :class:`scipy.sparse.csr_matrix`
+            Rows are papers, and columns are features (see
+            :attr:`.FeatureSet.lookup`\).
+        """
+        if sparse is None:
+            raise ImportError('Corpus.tfidf() requires numpy and scipy.')
 
-        return fclass({k:f for k,f in self.features[featureset_name].iteritems()
-                           if k in indices})
+        fset = self.features[featureset_name]
+        papers = list(fset.features.keys())
+
+        N, M = len(papers), len(fset.lookup)
+        lengths = [len(fset.features[paper]) for paper in papers]
+        pairs = [pair for paper in papers for pair in fset.features[paper]]
+        cols = np.fromiter((fset.lookup[elem] for elem, _ in pairs),
+                           dtype=np.int32, count=len(pairs))
+        counts = np.fromiter((count for _, count in pairs),
+                             dtype=float, count=len(pairs))
+        rows = np.repeat(np.arange(N, dtype=np.int32), lengths)
+
+        # Duplicate (paper, feature) entries are summed here, so each stored
+        #  column index below marks exactly one document.
+        tf = sparse.csr_matrix((counts, (rows, cols)), shape=(N, M))
+        tf.eliminate_zeros()
+        DC = np.bincount(tf.indices, minlength=M)
+        idf = np.log(float(N) / np.maximum(DC, 1))
+        tf.data *= idf[tf.indices]    # Weight all stored counts in one pass.
+        return papers, tf
+
+    def subfeatures(self, selector, featureset_name):
+        return self._subfeatures(self.select(selector, index_only=True),
+                                 featureset_name)
 
+    def _subfeatures(self, ids, featureset_name):
+        featureset = self.features[featureset_name]
+        fsclass = _featureset_class(featureset)
+        return fsclass({k: featureset.features[k] for k in ids
+                        if k in featureset.features})
 
     def subcorpus(self, selector):
         """
@@ -731,12 +1059,122 @@ class Corpus(object):
            >>> corpus = Corpus(papers)
            >>> subcorpus = corpus.subcorpus(('date', 1995))
            >>> subcorpus
-           <tethne.classes.corpus.Corpus object at 0x10278ea10>
+           <tethne.classes.corpus.CorpusView object at 0x10278ea10>
+
+        The new :class:`.Corpus` is a read-only :class:`.CorpusView` that
+        shares its papers, indices, and features with this one. Subclasses of
+        :class:`.Corpus` (e.g. :class:`.StreamingCorpus`) get a new instance
+        of the same class instead.
+        """
+        ids = self.select(selector, index_only=True)
+        if type(ids) is not list:   # A single paper was selected.
+            ids = [ids]
+        return self._subcorpus(ids)
+
+    def _subcorpus(self, ids):
+        """
+        Generates a new :class:`.Corpus` with the :class:`.Paper`\s in
+        ``ids``.
+        """
+        if type(self) not in [Corpus, CorpusView]:
+            # Subclasses may store papers differently (e.g. on disk), so
+            #  re-index the papers in the same kind of Corpus.
+            return self.__class__([self.indexed_papers[i] for i in ids],
+                                  index_by=self.index_by,
+                                  index_fields=list(self.indices.keys()),
+                                  index_features=list(self.features.keys()))
+        # A new view each time, so that indexing one subcorpus doesn't affect
+        #  the next one.
+        return CorpusView(self, ids)
+
+
+class CorpusView(Corpus):
+    """
+    A read-only subset of the :class:`.Paper`\s in another :class:`.Corpus`\.
+
+    :class:`.CorpusView`\s are generated by :meth:`.Corpus.subcorpus` and
+    :meth:`.Corpus.slice`\. Rather than re-indexing the selected papers, a
+    view shares the :class:`.Paper`\s, indices, and :class:`.FeatureSet`\s
+    of its parent. Indices are only restricted to the selected papers when
+    they are first used.
+    """
+
+    def __init__(self, parent, ids):
+        """
+        Parameters
+        ----------
+        parent : :class:`.Corpus`
+        ids : iterable
+            Identifiers of the :class:`.Paper`\s (in ``parent``) to include.
+        """
+        self._parent = parent
+        self._indices = None
+        self._indices_lookup = None
+
+        self.index_by = parent.index_by
+        self.index_fields = parent.index_fields
+        self.index_features = list(parent.features.keys())
+        self.slices = []
+        self.duplicate_papers = {}
+        self._slice_cache = {}
+        self._ids_list = None
+
+        self.indexed_papers = {i: parent.indexed_papers[i] for i in ids}
+        self._features = {}
+        self._feature_views = {}    # Views of the parent's FeatureSets.
 
+    @property
+    def features(self):
+        # Views of the parent's FeatureSets are resolved on every access, so
+        #  that FeatureSets added to (or replaced in) the parent after this
+        #  view was created are not missed. FeatureSets added to this view
+        #  directly (e.g. by index_feature) are left alone.
+        parent_features = self._parent.features
+        features = self._features
+        views = self._feature_views
+        for name, view in list(views.items()):
+            if features.get(name) is not view:      # Replaced locally.
+                del views[name]
+            elif parent_features.get(name) is not view.parent:
+                del views[name]
+                del features[name]
+        for name, featureset in parent_features.items():
+            if name not in features:
+                views[name] = featureset.view(self.indexed_papers)
+                features[name] = views[name]
+        return features
+
+    def _project_indices(self):
+        """
+        Restrict the parent's indices to the papers in this view.
         """
-        subcorpus = self.__class__(self[selector],
-                           index_by=self.index_by,
-                           index_fields=self.indices.keys(),
-                           index_features=self.features.keys())
+        self._indices = defaultdict(dict)
+        self._indices_lookup = defaultdict(dict)
+        for i in self.indexed_papers:
+            lookup = self._parent.indices_lookup.get(i, {})
+            for attr, values in lookup.items():
+                for v_ in values:
+                    self._indices[attr].setdefault(v_, []).append(i)
+                self._indices_lookup[i][attr] = list(values)
 
-        return subcorpus
+    @property
+    def indices(self):
+        if self._indices is None:
+            self._project_indices()
+        return self._indices
+
+    @property
+    def indices_lookup(self):
+        if self._indices_lookup is None:
+            self._project_indices()
+        return self._indices_lookup
+
+    def __getattr__(self, key):
+        if '_parent' not in self.__dict__:     # Not initialized yet.
+            raise AttributeError("Corpus has no such attribute")
+        if key in self.indices:
+            return self.indices[key]
+        raise AttributeError("Corpus has no such attribute")
+
+    def add_papers(self, papers):
+        raise TypeError('Cannot add papers to a CorpusView.')
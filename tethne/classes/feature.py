@@ -373,11 +373,12 @@ class BaseFeatureSet(object):
         return len(self.features)
 
     def count(self, elem):
-        logger.debug(u'Get count for {0}'.format(elem))
+        logger.debug(u'Get count for %s', elem)
         if elem in self.lookup:
             i = self.lookup[elem]
             count = self.counts[i]
-            logger.debug(u'Found elem %s with index %i and count %f' % (elem, i, count))
+            logger.debug(u'Found elem %s with index %i and count %f',
+                         elem, i, count)
             return count
         else:
             return 0.
@@ -391,6 +392,27 @@ class BaseFeatureSet(object):
     def papers_containing(self, elem):
         return self.with_feature[self.lookup[elem]]
 
+    def view(self, papers):
+        """
+        Get a read-only view of this :class:`.FeatureSet` that only includes
+        the features of ``papers``.
+
+        No features are copied; counts and lookups for the view are computed
+        from this :class:`.FeatureSet` the first time they are needed.
+
+        Parameters
+        ----------
+        papers : iterable
+            Paper identifiers.
+
+        Returns
+        -------
+        :class:`.FeatureSetView` or :class:`.StructuredFeatureSetView`
+        """
+        if isinstance(self, StructuredFeatureSet):
+            return StructuredFeatureSetView(self, papers)
+        return FeatureSetView(self, papers)
+
     def add(self, paper_id, feature):
         if type(feature) not in [Feature, StructuredFeature]:
             raise ValueError("""`feature` must be an instance of Feature or
@@ -504,17 +526,18 @@ class FeatureSet(BaseFeatureSet):
             features = dict()
         self._setUp()
 
-        logger.debug(u'Initialize FeatureSet with %i features' % len(features))
+        logger.debug(u'Initialize FeatureSet with %i features', len(features))
         self.features = features
         allfeatures = [v for v in chain(*features.values())]
-        logger.debug('features: {0}; allfeatures: {1}'.format(len(features), len(allfeatures)))
+        logger.debug('features: %i; allfeatures: %i',
+                     len(features), len(allfeatures))
         if len(features) > 0 and len(allfeatures) > 0:
             allfeatures_keys = zip(*allfeatures)[0]
 
             for i, elem in enumerate(set(allfeatures_keys)):
                 self.index[i] = elem
                 self.lookup[elem] = i
-                logger.debug(u'Add feature {0} with index {1}'.format(elem, i))
+                logger.debug(u'Add feature %s with index %i', elem, i)
 
             self.counts = defaultdict(float)
             for elem, v in allfeatures:
@@ -626,6 +649,119 @@ class FeatureSet(BaseFeatureSet):
         return vect
 
 
+class BaseFeatureSetView(object):
+    """
+    Read-only view of a subset of the papers in a feature set. Use
+    :meth:`.FeatureSet.view` to create one.
+    """
+
+    def __init__(self, parent, papers):
+        self.parent = parent
+        self.papers = set(papers)
+        self._features = None
+        self._lookup = None
+
+    def add(self, paper_id, feature):
+        raise TypeError('Cannot add features to a read-only FeatureSet view.')
+
+    @property
+    def features(self):
+        if self._features is None:
+            parent_features = self.parent.features
+            self._features = {k: parent_features[k] for k in self.papers
+                              if k in parent_features}
+        return self._features
+
+    def _aggregate(self):
+        """
+        Count the features in the view.
+        """
+        self._lookup, self._index = {}, {}
+        self._counts, self._documentCounts = Counter(), Counter()
+        self._with_feature = defaultdict(list)
+
+        for paper_id, feature in self.features.iteritems():
+            if len(feature) < 1:
+                continue
+            if type(feature[0]) is not tuple:
+                feature = Counter(feature).items()
+
+            for elem, value in feature:
+                i = self._lookup.get(elem, len(self._lookup))
+                self._lookup[elem] = i
+                self._index[i] = elem
+                self._counts[i] += value
+                self._documentCounts[i] += 1.
+                self._with_feature[i].append(paper_id)
+
+    @property
+    def lookup(self):
+        if self._lookup is None:
+            self._aggregate()
+        return self._lookup
+
+    @property
+    def index(self):
+        if self._lookup is None:
+            self._aggregate()
+        return self._index
+
+    @property
+    def counts(self):
+        if self._lookup is None:
+            self._aggregate()
+        return self._counts
+
+    @property
+    def documentCounts(self):
+        if self._lookup is None:
+            self._aggregate()
+        return self._documentCounts
+
+    @property
+    def with_feature(self):
+        if self._lookup is None:
+            self._aggregate()
+        return self._with_feature
+
+
+class FeatureSetView(BaseFeatureSetView, FeatureSet):
+    """
+    Read-only view of a subset of the papers in a :class:`.FeatureSet`\.
+    """
+
+    def count(self, elem):
+        if self._lookup is not None:
+            return super(FeatureSetView, self).count(elem)
+
+        # Avoid counting every feature in the view, if we only need one.
+        if elem not in self.parent.lookup:
+            return 0.
+        papers = self.parent.papers_containing(elem)
+        return sum([self.parent.features[p].value(elem) for p in papers
+                    if p in self.papers])
+
+
+class StructuredFeatureSetView(BaseFeatureSetView, StructuredFeatureSet):
+    """
+    Read-only view of a subset of the papers in a
+    :class:`.StructuredFeatureSet`\.
+    """
+
+
+def _featureset_class(featureset):
+    """
+    The class to use when building a new feature set like ``featureset``.
+    Views can't be instantiated from a dict of features, so for a view this is
+    :class:`.FeatureSet` or :class:`.StructuredFeatureSet`\.
+    """
+    if isinstance(featureset, BaseFeatureSetView):
+        if isinstance(featureset, StructuredFeatureSet):
+            return StructuredFeatureSet
+        return FeatureSet
+    return type(featureset)
+
+
 def feature(f):
     """
     Decorator for properties that should be represented as :class:`.Feature`\s.
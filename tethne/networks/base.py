@@ -3,7 +3,7 @@ from itertools import combinations
 from collections import Counter, defaultdict
 
 from tethne.utilities import _iterable
-from tethne import Corpus, FeatureSet, StructuredFeatureSet, StreamingCorpus
+from tethne import Corpus, FeatureSet, StructuredFeatureSet
 
 
 def _generate_graph(graph_class, pairs, node_attrs={}, edge_attrs={},
@@ -24,13 +24,13 @@ def _generate_graph(graph_class, pairs, node_attrs={}, edge_attrs={},
 
 
 def _get_featureset(corpus_or_featureset, featureset_name):
-    if type(corpus_or_featureset) in [Corpus, StreamingCorpus]:  # Retrieve FeatureSet from Corpus.
+    if isinstance(corpus_or_featureset, Corpus):  # Retrieve FeatureSet from Corpus.
         if not featureset_name:
             raise ValueError('featureset_name must be provided for Corpus')
         if featureset_name not in corpus_or_featureset.features:
             corpus_or_featureset.index_feature(featureset_name)
         return corpus_or_featureset.features[featureset_name]
-    elif type(corpus_or_featureset) in [FeatureSet, StructuredFeatureSet]:
+    elif isinstance(corpus_or_featureset, (FeatureSet, StructuredFeatureSet)):
         return corpus_or_featureset     # Already a FeatureSet.
     else:
         raise ValueError('First parameter must be Corpus or FeatureSet')
@@ -48,7 +48,7 @@ def cooccurrence(corpus_or_featureset, featureset_name=None, min_weight=1,
 
     featureset = _get_featureset(corpus_or_featureset, featureset_name)
 
-    if type(corpus_or_featureset) in [Corpus, StreamingCorpus]:
+    if isinstance(corpus_or_featureset, Corpus):
         attributes = {i: {a: corpus_or_featureset.indices_lookup[i][a] for a in edge_attrs}
                       for i in corpus_or_featureset.indexed_papers.keys()}
 
@@ -59,10 +59,10 @@ def cooccurrence(corpus_or_featureset, featureset_name=None, min_weight=1,
     # select applies filter to the elements in a (Structured)Feature. The
     #  iteration behavior of Feature and StructuredFeature are different, as is
     #  the manner in which the count for an element in each (Structured)Feature.
-    if type(featureset) is FeatureSet:
+    if isinstance(featureset, FeatureSet):
         select = lambda feature: [f for f, v in feature
                                   if filter(f, v, c(f), dc(f))]
-    elif type(featureset) is StructuredFeatureSet:
+    elif isinstance(featureset, StructuredFeatureSet):
         select = lambda feature: [f for f in feature
                                   if filter(f, feature.count(f), c(f), dc(f))]
 
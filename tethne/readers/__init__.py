@@ -15,6 +15,7 @@ a :class:`.Corpus` instance.
 """
 
 from tethne import Paper, Corpus
+from tethne.classes.feature import _featureset_class
 
 class DataError(Exception):
     def __init__(self, value):
@@ -108,11 +109,15 @@ def merge(corpus_1, corpus_2, match_by=['ayjid'], match_threshold=1.,
                 paper_new = Paper()
                 # We add values from paper_2 first, so that...
                 for key, value in paper_2.__dict__.iteritems():
+                    if key == '_tethne_id':     # Cached by Corpus.
+                        continue
                     if value not in ['', [], None]:
                         paper_new[key] = value
 
                 # ...values from paper_1 will override values from paper_2.
                 for key, value in paper_1.__dict__.iteritems():
+                    if key == '_tethne_id':     # Cached by Corpus.
+                        continue
                     if value not in ['', [], None]:
                         paper_new[key] = value
 
@@ -144,7 +149,7 @@ def merge(corpus_1, corpus_2, match_by=['ayjid'], match_threshold=1.,
         features = {}
 
         # Can be FeatureSet or StructuredFeatureSet.
-        fclass = type(featureset_1)
+        fclass = _featureset_class(featureset_1)
         if featureset_name in corpus_2.features:
             featureset_2 = corpus_2.features[featureset_name]
             for index, feature in featureset_2.iteritems():
@@ -166,7 +171,7 @@ def merge(corpus_1, corpus_2, match_by=['ayjid'], match_threshold=1.,
         features = {}
 
         # Can be FeatureSet or StructuredFeatureSet.
-        fclass = type(featureset_2)
+        fclass = _featureset_class(featureset_2)
         for index, feature in featureset_2.iteritems():
             features[getattr(corpus_2[index], index_by)] = feature
 
@@ -2,8 +2,11 @@ import sys
 sys.path.append('./')
 
 import unittest
+import hashlib
+from math import log
 from tethne.readers.wos import read
 from tethne import Corpus, Paper, FeatureSet, Feature
+from tethne.classes.corpus import CorpusView
 from tethne.utilities import _iterable
 
 datapath = './tethne/tests/data/wos.txt'
@@ -45,6 +48,31 @@ class TestCorpus(unittest.TestCase):
             self.assertEqual(len(corpus.indices[field]), expected,
                              'Index for {0} is the wrong size.'.format(field))
 
+    def test_generate_index_cached(self):
+        """
+        Cached identifiers should not leak between different ``index_by``.
+        """
+        corpus = Corpus(self.papers, index_by='wosid')
+        hashed = Corpus(self.papers)
+
+        for paper in self.papers:
+            self.assertEqual(corpus._generate_index(paper), paper.wosid)
+            self.assertEqual(hashed._generate_index(paper), paper.hashIndex)
+
+    def test_generate_index_md5(self):
+        """
+        Generated identifiers are MD5 digests of the title and author names,
+        regardless of which optional packages are installed.
+        """
+        paper = Paper()
+        paper.title = u'A title'
+        paper.authors_full = [(u'LAST', u'FIRST')]
+        corpus = Corpus([paper])
+
+        expected = hashlib.md5(u'A title LASTFIRST'.encode('utf-8'))
+        self.assertEqual(paper.hashIndex, expected.hexdigest())
+        self.assertIn(expected.hexdigest(), corpus.indexed_papers)
+
     def test_slice(self):
         corpus = Corpus(self.papers, index_by='wosid')
         for key, papers in corpus.slice():
@@ -83,6 +111,70 @@ class TestCorpus(unittest.TestCase):
 
         self.assertEqual(len(allpapers[0][1]), 10)
 
+    def test_slice_independent(self):
+        """
+        Indexing a subcorpus should not affect later slices.
+        """
+        corpus = Corpus(self.papers, index_by='wosid')
+        for key, subcorpus in corpus.slice():
+            subcorpus.index('journal')
+            subcorpus.index_feature('journal')
+
+        for key, subcorpus in corpus.slice():
+            self.assertNotIn('journal', subcorpus.indices)
+            self.assertNotIn('journal', subcorpus.features)
+        self.assertNotIn('journal', corpus.indices)
+
+    def test_slice_cached_features(self):
+        """
+        Cached results should see :class:`.FeatureSet`\s that are added or
+        replaced after they were computed.
+        """
+        corpus = Corpus(self.papers, index_by='wosid')
+        corpus.top_features('citations', perslice=True)
+        before = corpus.feature_distribution('authors', (u'SOTO', u'MANU'))
+
+        double = lambda f, v, c, dc: v * 2
+        citations = corpus.features['citations'].transform(double)
+        corpus.features['citations_doubled'] = citations
+        corpus.features['authors'] = corpus.features['authors'].transform(double)
+
+        top = corpus.top_features('citations_doubled', perslice=True)
+        self.assertEqual(len(top), len(corpus.indices['date']))
+        after = corpus.feature_distribution('authors', (u'SOTO', u'MANU'))
+        self.assertListEqual(after[1], [2 * v for v in before[1]])
+
+    def test_subcorpus_view(self):
+        """
+        Subcorpora share :class:`.Paper` instances with their parent.
+        """
+        corpus = Corpus(self.papers, index_by='wosid')
+        subcorpus = corpus.subcorpus(('date', 2012))
+
+        self.assertIsInstance(subcorpus, CorpusView)
+        self.assertEqual(len(subcorpus), 5)
+        for i, paper in subcorpus.indexed_papers.items():
+            self.assertIs(paper, corpus.indexed_papers[i])
+        self.assertListEqual(list(subcorpus.indices['date'].keys()), [2012])
+        self.assertEqual(len(subcorpus.features['authors'].features), 5)
+        self.assertRaises(TypeError, subcorpus.add_papers, self.papers)
+
+    def test_subcorpus_index_feature(self):
+        """
+        :class:`.FeatureSet`\s added to a subcorpus are kept alongside the
+        views of its parent's :class:`.FeatureSet`\s.
+        """
+        corpus = Corpus(self.papers, index_by='wosid')
+        for key, subcorpus in corpus.slice():
+            subcorpus.index_feature('journal')
+            self.assertIn('journal', subcorpus.features)
+            self.assertIn('authors', subcorpus.features)
+            self.assertNotIn('journal', corpus.features)
+
+            subcorpus.features['local'] = FeatureSet()
+            self.assertIn('local', subcorpus.features)
+            self.assertIn('journal', subcorpus.features)
+
     def test_distribution(self):
         corpus = Corpus(self.papers, index_by='wosid')
         values = corpus.distribution()
@@ -96,6 +188,28 @@ class TestCorpus(unittest.TestCase):
         self.assertEqual(len(values[0]), len(values[1]))
         self.assertListEqual(values[1], [0, 1])
 
+    def test_feature_year_matrix(self):
+        corpus = Corpus(self.papers, index_by='wosid')
+        years, matrix = corpus.feature_year_matrix('authors')
+        fset = corpus.features['authors']
+
+        self.assertListEqual(years, [2012, 2013])
+        self.assertEqual(matrix.shape, (len(years), len(fset.lookup)))
+        for elem, i in fset.lookup.items():
+            self.assertEqual(matrix[:, i].sum(), fset.count(elem))
+
+    def test_tfidf(self):
+        corpus = Corpus(self.papers, index_by='wosid')
+        papers, matrix = corpus.tfidf('citations')
+        fset = corpus.features['citations']
+        N = len(papers)
+
+        self.assertEqual(matrix.shape, (N, len(fset.lookup)))
+        for i, paper in enumerate(papers):
+            for elem, count in fset.features[paper]:
+                expected = count * log(float(N)/fset.documentCount(elem))
+                self.assertAlmostEqual(matrix[i, fset.lookup[elem]], expected)
+
     def test_getitem(self):
         corpus = Corpus(self.papers, index_by='wosid')
 
@@ -108,6 +222,36 @@ class TestCorpus(unittest.TestCase):
         self.assertEqual(len(corpus[ikeys]), len(ikeys))
         self.assertIsInstance(corpus[ikeys][0], Paper)
 
+    def test_papers(self):
+        """
+        Changing the list returned by :attr:`.Corpus.papers` should not affect
+        selection.
+        """
+        corpus = Corpus(self.papers, index_by='wosid')
+        first = corpus[0]
+        papers = corpus.papers
+        papers.reverse()
+        papers.pop()
+
+        self.assertEqual(len(corpus.papers), 10)
+        self.assertIs(corpus[0], first)
+        self.assertIs(corpus[[0]][0], first)
+        self.assertEqual(len(corpus[('date', [2012, 2013])]), 10)
+
+    def test_select_multiple_values(self):
+        """
+        A list of index values should yield each matching paper once.
+        """
+        corpus = Corpus(self.papers, index_by='wosid')
+        citations = list(corpus.indices['citations'].keys())[:20]
+        expected = set([i for c in citations
+                        for i in corpus.indices['citations'][c]])
+
+        selected = corpus.select(('citations', citations), index_only=True)
+        self.assertEqual(len(selected), len(expected))
+        self.assertSetEqual(set(selected), expected)
+        self.assertIsInstance(corpus['citations', citations][0], Paper)
+
     def test_top_features(self):
         corpus = Corpus(self.papers, index_by='wosid')
 
@@ -265,6 +265,32 @@ class TestFeatureSet(unittest.TestCase):
         self.assertGreater(sum(v_norm), 0)
         self.assertEqual(sum(v_norm), 1.0)
 
+    def test_view(self):
+        featureset = FeatureSet()
+        feature = Feature([('bob', 3), ('joe', 1), ('bobert', 1)])
+        feature2 = Feature([('blob', 3), ('joe', 1), ('brobert', 1)])
+        feature3 = Feature([('blob', 1), ('joe', 1), ('brobert', 1)])
+        featureset.add('p1', feature)
+        featureset.add('p2', feature2)
+        featureset.add('p3', feature3)
+
+        view = featureset.view(['p2', 'p3'])
+        self.assertIsInstance(view, FeatureSet)
+        self.assertEqual(len(view), 2)
+        self.assertIs(view['p2'], feature2)
+
+        # Counts are available before and after the view is fully counted.
+        self.assertEqual(view.count('blob'), 4)
+        self.assertEqual(view.count('bob'), 0)
+        self.assertEqual(view.documentCount('joe'), 2)
+        self.assertEqual(view.count('blob'), 4)
+        self.assertSetEqual(view.unique, set(['blob', 'joe', 'brobert']))
+        self.assertSetEqual(set(view.papers_containing('joe')),
+                            set(['p2', 'p3']))
+        self.assertEqual(len(view.as_matrix()[0]), len(view.unique))
+
+        self.assertRaises(TypeError, view.add, 'p4', feature)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,8 @@ import networkx as nx
 from tethne.classes.graphcollection import GraphCollection
 from tethne.readers.wos import read
 from tethne.networks.authors import coauthors
+from tethne.networks.papers import cocitation
+from tethne import Corpus
 
 
 datapath = './tethne/tests/data/wos.txt'
@@ -69,6 +71,25 @@ class TestGraphCollectionCreation(unittest.TestCase):
         G.build(corpus, coauthors)
         self.assertEqual(len(G), len(corpus.indices['date']))
 
+    def test_build_slices(self):
+        """
+        Graphs built from slices should match graphs built from the same
+        papers in a separate :class:`.Corpus`\.
+        """
+        corpus = read(datapath)
+        G = GraphCollection(corpus, coauthors)
+        for key, subcorpus in corpus.slice():
+            expected = coauthors(Corpus(subcorpus.papers))
+            nodes = [G.node_index[n] for n in G[key].nodes()]
+            self.assertEqual(sorted(nodes), sorted(expected.nodes()))
+            self.assertEqual(G[key].number_of_edges(),
+                             expected.number_of_edges())
+
+            edges = lambda g: sorted([tuple(sorted(e)) for e in g.edges()])
+            graph = cocitation(subcorpus.features['citations'])
+            expected = cocitation(Corpus(subcorpus.papers).features['citations'])
+            self.assertEqual(edges(graph), edges(expected))
+
     def test_build_streaming(self):
         """
         """
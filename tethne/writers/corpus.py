@@ -26,9 +26,9 @@ def write_documents(corpus, target, featureset_name, metadata_fields=[]):
     docpath = target + '_docs.txt'
     metapath = target + '_meta.csv'
 
-    features = corpus.features[featureset_name].features
-    ftype = type(corpus.features[featureset_name])
-    index = corpus.features[featureset_name].index
+    featureset = corpus.features[featureset_name]
+    features = featureset.features
+    index = featureset.index
 
     try:
         docFile = open(docpath, 'wb')
@@ -48,9 +48,9 @@ def write_documents(corpus, target, featureset_name, metadata_fields=[]):
         for i, p in corpus.indexed_papers.iteritems():
             if i in features:
                 row = [i, u'en']
-                if ftype is FeatureSet:
+                if isinstance(featureset, FeatureSet):
                     row += [u' '.join(repeat(e, c)) for e, c in features[i]]
-                elif ftype is StructuredFeatureSet:
+                elif isinstance(featureset, StructuredFeatureSet):
                     row += features[i]
                 f.write(u'\t'.join(row) + u'\n')
 